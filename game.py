@@ -20,21 +20,24 @@ class potential_game():
         rewards (list): A list to store the rewards history.
         actions_chosen (list): A list to store the chosen actions history.
         t (int): Time step counter.
+        rng (numpy.random.Generator): Random number generator for the noise.
 
     Methods:
-        __init__(self, Potential, unknown_utilitys, nl): Initialize the potential game object with necessary parameters.
+        __init__(self, Potential, unknown_utilitys, nl, rng=None): Initialize the potential game object with necessary parameters.
         sample(self, sample_tuple): Sample a new action and update parameters.
         check_game(self): Check if the given game is a valid potential game.
     """
 
     # Initialize the potential game object with necessary parameters
-    def __init__(self, Potential, unknown_utilitys, nl):
+    def __init__(self, Potential, unknown_utilitys, nl, rng=None):
         # Set number of actions for each player
         self.n = np.shape(Potential)[0]
         # Set number of players
         self.k = len(unknown_utilitys)
         # Set noise level
         self.nl = nl
+        # Set random number generator
+        self.rng = np.random.default_rng(rng)
 
         # Set shape of arrays for internal use
         self.shape = [self.n] * self.k
@@ -68,9 +71,11 @@ class potential_game():
         self.t += 1
         # Increment the count of the action being sampled
         self.number[sample_tuple] += 1
+        # Draw the noise for all players at once
+        noise = self.rng.normal(0, self.nl, self.k)
         # Update the accumulators and rewards for each player
         for p in range(self.k):
-            u_val = self.utility_matrices[p][sample_tuple] + np.random.normal(0, self.nl)
+            u_val = self.utility_matrices[p][sample_tuple] + noise[p]
             self.sum[p][sample_tuple] += u_val
             self.sum_squared[p][sample_tuple] += u_val**2
             rewards[p] = u_val
@@ -117,9 +122,10 @@ class congestion_game():
         utility_matrices (list): A list of utility matrices for each agent in the extended game.
         MaxU (int): The maximum utility value in the game.
         MinU (int): The minfsliceimum utility value in the game.
+        rng (numpy.random.Generator): Random number generator for the noise and initial actions.
 
     Methods:
-        __init__(self, facility_means, number_agents, nl): Initialize the congestion game object with necessary parameters.
+        __init__(self, facility_means, number_agents, nl, s, action_space=None, rng=None): Initialize the congestion game object with necessary parameters.
         sample(self, action_chosen): Sample a new action and update the game's state.
         number_for_each_facility(self, action_chosen): Calculate the number of agents visiting each facility.
         potential_utilities_for_regret(self): Calculate potential and utility matrices
@@ -127,13 +133,14 @@ class congestion_game():
     """
 
     # Initialize the congestion game object with necessary parameters
-    def __init__(self,facility_means,number_agents,nl,s,action_space=None):
+    def __init__(self,facility_means,number_agents,nl,s,action_space=None,rng=None):
 
         # Store input parameters
         self.number_facilities = len(facility_means)
         self.facility_means = facility_means
         self.nl = nl
         self.s = s
+        self.rng = np.random.default_rng(rng)
 
         # Initialize history of agent rewards and actions chosen
         self.agent_rewards = []
@@ -162,7 +169,7 @@ class congestion_game():
         # Initialize counters and accumulators
 
         # Initialize the game with random actions for each agent
-        random_list = [np.random.randint(1, len(self.actions[i])) for i in range(self.k)]
+        random_list = [self.rng.integers(1, len(self.actions[i])) for i in range(self.k)]
 
         if self.s != "nash_ucb":
             self.number = np.zeros(self.shape)
@@ -187,7 +194,8 @@ class congestion_game():
         numbers = self.number_for_each_facility(action_chosen)
 
         # Compute facility rewards with noise and clip them between 0 and 1
-        facility_rewards = np.clip([self.facility_means[i][int(numbers[i]) - 1] + np.random.normal(0, self.nl) for i in range(self.number_facilities)], -1, 1)
+        noise = self.rng.normal(0, self.nl, self.number_facilities)
+        facility_rewards = np.clip([self.facility_means[i][int(numbers[i]) - 1] + noise[i] for i in range(self.number_facilities)], -1, 1)
 
         # Initialize rewards array for the current step
         rewards = np.zeros(self.k)
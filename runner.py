@@ -2,7 +2,7 @@ import argparse
 import numpy as np
 from game import potential_game, congestion_game
 
-from utils.algos import optimistic_solver,nash_ucb,exponential_weights_annealing,nash_ca,optimistic_solver_2
+from utils.algos import optimistic_solver,nash_ucb,exponential_weights_annealing,nash_ca
 from utils.regret import regret
 from utils.game_maker import make_game
 from utils.updates import opt_pes_make
@@ -10,6 +10,18 @@ from utils.updates import opt_pes_make
 import json
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Game types that are played as congestion games
+CONGESTION_GAMES = ("congestion", "single_routing", "double_routing")
+
+# Constructors for each solver, called with the game, constant, alpha, number of iterations and random generator
+SOLVERS = {
+    "optimistic": lambda Game, c, alpha, iterations, rng: optimistic_solver(Game, c, alpha, opt_pes_make(Game.shape), rng),
+    "nash_ucb": lambda Game, c, alpha, iterations, rng: nash_ucb(Game, c, iterations, rng),
+    "exp_weight": lambda Game, c, alpha, iterations, rng: exponential_weights_annealing(Game, c, alpha),
+    "nash_ca": lambda Game, c, alpha, iterations, rng: nash_ca(Game, c, alpha),
+}
 
 def generate_filename():
     """
@@ -76,9 +88,9 @@ def save_simulation_results(filename, kwargs, regrets, av_regret_val, run_times)
         "run_times": run_times  # Add run times to the data dictionary
     }
 
-    # Save the data to a JSON file
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=4)
+    # Save the data to a JSON file, compact so each regret value is not written on its own indented line
+    with open(filename, "w", buffering=1 << 16) as f:
+        json.dump(data, f, separators=(",", ":"))
 
 def parse_args():
     """
@@ -104,6 +116,8 @@ def parse_args():
                         help='Game Type')
     parser.add_argument("-s", "--solver", default="optimistic", type=str,
                         help='Which solver to use')
+    parser.add_argument("-sd", "--seed", default=None, type=int,
+                        help='Base random seed, run r uses seed + r')
 
     return parser.parse_args()
 
@@ -121,6 +135,7 @@ def main(**kwargs):
         alpha (float): Alpha parameter.
         game (str): Game type (e.g. "congestion" or "random").
         solver (str): Solver to use (e.g. "nash_ca" or "nash_ucb").
+        seed (int): Base random seed, run r uses seed + r (optional).
 
     Returns:
         None
@@ -154,92 +169,116 @@ def main(**kwargs):
 
     iterations = t_max
 
-    regrets = [[],[],[]]
+    # Runs are independent, so seed each one from a base seed so results do not depend on the number of workers
+    seed_base = kwargs.get("seed")
+    if seed_base is None:
+        seed_base = int(np.random.default_rng().integers(2**31))
+
+    run_args = [(r, seed_base + r, g, n, k, nl, s, c, alpha, iterations) for r in range(runs)]
 
-    run_times = []  # Initialize a list to store the run times
+    if runs == 1:
+        results = [run_once(*run_args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(run_once, *args) for args in run_args]
+            results = [future.result() for future in futures]
+
+    # Collect the results of each run in order, grouped by regret type
+    regrets = np.stack([run_regrets for run_regrets, _, _ in results], axis=1).tolist()
+    run_times = [run_duration for _, _, run_duration in results]
+    av_regret_vals = results[-1][1]
 
-    # Iterate through the specified number of runs
-    for r in range(runs):
-        start_time = time.time()  # Record the start time of the simulation
+    filename, timestamp = generate_filename()
+    save_simulation_results(filename, kwargs, regrets, av_regret_vals, run_times)  # Pass run_times to the function
+    update_log_file(timestamp, kwargs)
 
-        print(r)
-        regrets[0].append([])
-        regrets[1].append([])
-        regrets[2].append([])
+def run_once(r, seed, g, n, k, nl, s, c, alpha, iterations):
+    """
+    Run a single simulation of a solver on a newly generated game.
 
+    Args:
+        r (int): Index of the run.
+        seed (int): Seed for the random number generator of the run.
+        g (str): Game type.
+        n (int): Number of strategies for each player.
+        k (int): Number of players.
+        nl (float): Noise level.
+        s (str): Solver to use.
+        c (float): Constant.
+        alpha (float): Alpha parameter.
+        iterations (int): Number of timesteps.
+
+    Returns:
+        tuple: Array of the nash, potential and Nikaido-Isoda regrets of each timestep, the average regret values of
+        the game and the run time of the simulation.
+    """
+    start_time = time.time()  # Record the start time of the simulation
+
+    # Every random draw of the run comes from this generator
+    rng = np.random.default_rng(seed)
+
+    print(r)
+    regrets = np.empty((3, iterations))
+
+    # Initialize the game and solver based on the provided game type and solver type
+    if g in CONGESTION_GAMES:
+        number_facilities, number_agents, facility_means,action_space = make_game(g, n, k, rng)
+        Game = congestion_game(facility_means,number_agents,nl, s,action_space,rng)
+        # Instantiate a regret object and initialize cumulative regret
+        reg = regret(Game,s)
+    else:
+        Potential, unknown_utilitys = make_game(g, n, k, rng)
+        Game = potential_game(Potential, unknown_utilitys,nl,rng)
+        # Instantiate a regret object and initialize cumulative regret
+        reg = regret(Game,s)
+
+    if s not in SOLVERS:
+        raise RuntimeError("Not a valid algorithm!")
+    algorithm = SOLVERS[s](Game, c, alpha, iterations, rng)
+
+    # Run the simulation for the specified number of iterations
+    for t in range(iterations):
+        if t % 100 == 0:
+            print(t)
+        if s == "nash_ucb":
+            sample_tuple = algorithm.next_sample_prob(Game)
+            Game.sample(tuple(sample_tuple))
+            regrets[:, t] = reg.regret_congestion(Game,sample_tuple)
 
-        # Initialize the game and solver based on the provided game type and solver type
-        if g == "congestion" or g == "single_routing" or g == "double_routing":
-            number_facilities, number_agents, facility_means,action_space = make_game(g, n, k)
-            Game = congestion_game(facility_means,number_agents,nl, s,action_space)
-            # Instantiate a regret object and initialize cumulative regret
-            reg = regret(Game,s)
-        else:
-            Potential, unknown_utilitys = make_game(g, n, k)
-            Game = potential_game(Potential, unknown_utilitys,nl)
-            # Instantiate a regret object and initialize cumulative regret
-            reg = regret(Game,s)
-
-        if s == "optimistic":
-            matrices = opt_pes_make(Game.shape)
-            algorithm = optimistic_solver(Game,c, alpha, matrices)
-        elif s == "nash_ucb":
-            algorithm = nash_ucb(Game, c, iterations)
-        elif s == "exp_weight":
-            algorithm = exponential_weights_annealing(Game, c, alpha)
-        elif s == "nash_ca":
-            algorithm = nash_ca(Game, c, alpha)
         else:
-            raise RuntimeError("Not a valid algorithm!")
-
-        # Run the simulation for the specified number of iterations
-        for t in range(iterations):
-            if t % 100 == 0:
-                print(t)
-            if s == "nash_ucb":
-                sample_tuple = algorithm.next_sample_prob(Game)
-                Game.sample(tuple(sample_tuple))
-                three_regret = reg.regret_congestion(Game,sample_tuple)
-                regrets[0][r].append(three_regret[0])
-                regrets[1][r].append(three_regret[1])
-                regrets[2][r].append(three_regret[2])
-
-            else:
-                #Generate probability tensor over all choices
-                prob = algorithm.next_sample_prob(Game)
-
-                #Sample choice from probability tensor
-                choice = np.random.choice(np.arange(prob.size), p=prob.flatten())
-                sample_tuple = np.unravel_index(choice, prob.shape)
-                prob_2 = np.zeros(prob.shape)
-                prob_2[tuple(sample_tuple)] = 1
-
-                #Sample this joint action from the game
-                Game.sample(tuple(sample_tuple))
-
-                #Calculate regret and append lists
-                regrets[0][r].append(reg.regrets("nash",prob_2))
-                regrets[1][r].append(reg.regrets("potential",prob_2))
-                regrets[2][r].append(reg.regrets("nikaido_isoda",prob_2))
-
-            #Output log
-            # print("______")
-            # print(t)
-            # print("Sample: ", sample_tuple)
-            # print("Nash Regret: ", regrets[0][r][t])
-
-        end_time = time.time()  # Record the end time of the simulation
-        run_duration = end_time - start_time  # Calculate the duration of the run
-        run_times.append(run_duration)  # Append the run duration to the run_times list
-
-    if g == "congestion" or g == "single_routing" or g == "double_routing":
+            #Generate probability tensor over all choices
+            prob = algorithm.next_sample_prob(Game)
+
+            #Sample choice from probability tensor by inverting its cumulative distribution
+            cdf = np.cumsum(prob.ravel())
+            choice = np.searchsorted(cdf, rng.random() * cdf[-1], side="right")
+            sample_tuple = np.unravel_index(choice, prob.shape)
+            prob_2 = np.zeros(prob.shape)
+            prob_2[sample_tuple] = 1
+
+            #Sample this joint action from the game
+            Game.sample(sample_tuple)
+
+            #Calculate regret and store it
+            regrets[0, t] = reg.regrets("nash",prob_2)
+            regrets[1, t] = reg.regrets("potential",prob_2)
+            regrets[2, t] = reg.regrets("nikaido_isoda",prob_2)
+
+        #Output log
+        # print("______")
+        # print(t)
+        # print("Sample: ", sample_tuple)
+        # print("Nash Regret: ", regrets[0, t])
+
+    if g in CONGESTION_GAMES:
         av_regret_vals = [0,0,0]
     else:
         av_regret_vals = reg.av_regret()
 
-    filename, timestamp = generate_filename()
-    save_simulation_results(filename, kwargs, regrets, av_regret_vals, run_times)  # Pass run_times to the function
-    update_log_file(timestamp, kwargs)
+    end_time = time.time()  # Record the end time of the simulation
+    run_duration = end_time - start_time  # Calculate the duration of the run
+
+    return regrets, av_regret_vals, run_duration
 
 if __name__ == "__main__":
     """
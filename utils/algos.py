@@ -1,7 +1,6 @@
 import numpy as np
-from numpy import random as rand
 from utils.updates import opt_pes_recalc
-import itertools
+from functools import reduce
 
 class exponential_weights_annealing():
     """
@@ -45,11 +44,8 @@ class exponential_weights_annealing():
         for i in range(self.k):
             self.Xs[i] = self.epsilon*(np.ones(self.n)/self.n) + (1-self.epsilon)*self.logit_choice_map(self.Ys[i])
 
-        tuples = list(itertools.product(*[range(dim) for dim in game.shape]))
-        phi = np.zeros(game.shape)
-        for tuple_ in tuples:
-            vec = [self.Xs[p][tuple_[p]] for p in range(self.k)]
-            phi[tuple_] = np.prod(vec)
+        # Players mix independently, so the joint distribution is the outer product of their strategies
+        phi = reduce(np.multiply.outer, self.Xs)
         return phi
     def update_ys(self,game):
 
@@ -163,17 +159,18 @@ class nash_ca():
     def get_a_hat(self):
         current_policy = self.current_policy
         current_agent = self.current_player
-        slices = [slice(None) if j == current_agent else int(current_policy[j]) for j in range(len(current_policy))]
+        slices = tuple(slice(None) if j == current_agent else int(current_policy[j]) for j in range(len(current_policy)))
         return np.argmax(self.means[current_agent][slices])
 
     def ucb_sub_routine(self,game):
         current_policy = self.current_policy
         current_agent = self.current_player
 
-        slices = [slice(None) if j == current_agent else int(current_policy[j]) for j in range(len(current_policy))]
+        # Gather the agent's deviations from the current policy in one indexing operation
+        slices = tuple(slice(None) if j == current_agent else int(current_policy[j]) for j in range(len(current_policy)))
         mean_vector = self.means[current_agent][slices]
         number_vector = game.number[slices]
-        number_vector_clean = [number_vector[i] if number_vector[i] != 0 else 1 for i in range(game.number.shape[current_agent])]
+        number_vector_clean = np.where(number_vector != 0, number_vector, 1)
         t = np.sum(number_vector)
         ucb = mean_vector + self.c*np.sqrt(np.log(t)/number_vector_clean)
 
@@ -198,19 +195,21 @@ class optimistic_solver():
     """
     custom optimistic solver algorithm class.
     """
-    def __init__(self, game, c, alpha, matrices):
+    def __init__(self, game, c, alpha, matrices, rng=None):
         """
         Initialize the optimistic_solver class.
 
         :param game: The game object representing the game to solve.
         :param c: The exploration-exploitation trade-off constant.
         :param alpha: The random probability threshold for exploration.
+        :param rng: The random number generator for exploration.
         """
 
         self.k = game.k
         self.c = c
 
         self.alpha = alpha
+        self.rng = np.random.default_rng(rng)
         # Calculate and store the optimization and pessimistic matrices
         self.matrices = matrices
 
@@ -219,8 +218,15 @@ class optimistic_solver():
         self.shape = game.shape
 
         # Initialize optimistic and pessimistic utility matrices
-        self.OptUs = [np.ones(self.shape) * game.MaxU for i in range(self.k)]
-        self.PesUs = [np.ones(self.shape) * game.MinU for i in range(self.k)]
+        self.OptUs = [np.full(self.shape, game.MaxU, dtype=float) for i in range(self.k)]
+        self.PesUs = [np.full(self.shape, game.MinU, dtype=float) for i in range(self.k)]
+
+        # Initialize optimistic and pessimistic means, unsampled actions default to the utility bounds
+        self.OptMeans = [np.full(self.shape, game.MaxU, dtype=float) for i in range(self.k)]
+        self.PesMeans = [np.full(self.shape, game.MinU, dtype=float) for i in range(self.k)]
+
+        # Number of the game's chosen actions already folded into the means
+        self.number_seen = 0
 
     def update_us(self, game):
         """
@@ -228,19 +234,21 @@ class optimistic_solver():
 
         :param game: The game object representing the game to solve.
         """
-        tuples = list(itertools.product(*[range(dim) for dim in self.shape]))
-
+        # Only the actions sampled since the last update have new means
+        for tuple_ in game.actions_chosen[self.number_seen:]:
+            tuple_ = tuple(tuple_)
+            for p in range(self.k):
+                self.OptMeans[p][tuple_] = game.sum[p][tuple_] / game.number[tuple_]
+                self.PesMeans[p][tuple_] = self.OptMeans[p][tuple_]
+        self.number_seen = len(game.actions_chosen)
+
+        # Confidence bonus is shared by all players, unsampled actions count as sampled once
+        bonus = self.c * np.sqrt(np.log(game.t) / np.maximum(game.number, 1))
+
+        # Update the optimistic and pessimistic utility matrices with UCB and LCB respectively
         for p in range(self.k):
-            for tuple_ in tuples:
-                # Calculate the optimistic and pessimistic means
-                opt_mean = game.sum[p][tuple_] / game.number[tuple_] if game.number[tuple_] > 0 else game.MaxU
-                pes_mean = game.sum[p][tuple_] / game.number[tuple_] if game.number[tuple_] > 0 else game.MinU
-
-                number = 1 if game.number[tuple_] == 0 else game.number[tuple_]
-
-                # Update the optimistic and pessimistic utility matrices with UCB and LCB respectively
-                self.OptUs[p][tuple_] = opt_mean + self.c * np.sqrt(np.log(game.t) / number)
-                self.PesUs[p][tuple_] = pes_mean - self.c * np.sqrt(np.log(game.t) / number)
+            np.add(self.OptMeans[p], bonus, out=self.OptUs[p])
+            np.subtract(self.PesMeans[p], bonus, out=self.PesUs[p])
 
     def update_potential(self):
         """
@@ -260,19 +268,19 @@ class optimistic_solver():
         self.update_us(game)
         self.update_potential()
 
-        # Find the tuple with the maximum optimistic potential
-        max_tuple = np.unravel_index(np.argmax(self.OptPhi), self.OptPhi.shape)
-        phi = np.zeros(self.shape)
-        phi[max_tuple] = 1
-
         # Explore other sample with random probability
-        a = np.random.rand(1)
+        a = self.rng.random()
         alpha = 0.1*np.exp(np.log(self.alpha)*game.t/(np.prod(self.shape)))
         if (a < alpha) and (game.t > 1):
-            phi_2 = np.copy(self.OptPhi)
-            phi_2 = phi_2 - np.min(self.OptPhi)
-            phi_2 /= np.sum(phi_2)
-            phi = np.copy(phi_2)
+            # Shift and normalise the optimistic potential in place on a single new buffer
+            phi = np.subtract(self.OptPhi, np.min(self.OptPhi))
+            phi /= np.sum(phi)
+            return phi
+
+        # Otherwise choose the tuple with the maximum optimistic potential
+        max_tuple = np.unravel_index(np.argmax(self.OptPhi), self.OptPhi.shape)
+        phi = np.zeros(self.shape)
+        phi[max_tuple] = 1
         return phi
 
 class nash_ucb():
@@ -280,13 +288,14 @@ class nash_ucb():
     Nash UCB class for learning in congestion games with bandit feedback.
     """
 
-    def __init__(self, game, c, iterations):
+    def __init__(self, game, c, iterations, rng=None):
         """
         Initialize the nash_ucb class.
 
         :param game: The game object representing the environment.
         :param c: The exploration-exploitation trade-off constant.
         :param iterations: The number of iterations to run the algorithm.
+        :param rng: The random number generator for the initial policies.
         """
 
         self.number_agents = game.k
@@ -301,6 +310,7 @@ class nash_ucb():
         self.ar_sum = np.zeros(self.d)
         self.epsilon = 0.001
         self.action_spaces = game.actions
+        self.rng = np.random.default_rng(rng)
         self.t = 0
 
     def a_i_function(self, i: int, ja_tuple: tuple) -> list:
@@ -361,7 +371,7 @@ class nash_ucb():
 
     def solve_potential_game(self):
 
-        policy_tuple = tuple([np.random.randint(1, len(self.action_spaces[i])) for i in range(self.number_agents)])
+        policy_tuple = tuple([self.rng.integers(1, len(self.action_spaces[i])) for i in range(self.number_agents)])
 
         K = np.ceil(self.number_agents * self.number_agents*self.number_facilities / self.epsilon)
 
@@ -371,10 +381,12 @@ class nash_ucb():
             for p in range(self.number_agents):
                 policy_reward = self.reward_calc(policy_tuple,p)
                 indexs = [self.tuple_changer(policy_tuple, k, p) for k in range(len(self.action_spaces[p]))]
-                vector = [self.reward_calc(tuple(tuple_), p) for tuple_ in indexs]
+                vector = np.array([self.reward_calc(tuple(tuple_), p) for tuple_ in indexs])
 
-                indices[p] = np.argmax(vector - policy_reward)
-                deltas[p] = np.max(vector - policy_reward)
+                # Best deviation and its gain from a single argmax
+                gains = vector - policy_reward
+                indices[p] = np.argmax(gains)
+                deltas[p] = gains[int(indices[p])]
 
             if np.max(deltas) <= self.epsilon:
                 return policy_tuple
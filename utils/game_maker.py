@@ -1,7 +1,32 @@
-from numpy import random as rand
 import numpy as np
 
-def make_game(game_type, n, k):
+def utilities_from_potential(Potential, k):
+    """
+    Builds each player's utility matrix from a potential, such that utility differences along a player's own axis
+    match the potential differences. Player p's utility is the potential minus its first slice along axis p, plus 0.25.
+
+    Args:
+        Potential (numpy.ndarray): The potential matrix of the game.
+        k (int): The number of players.
+
+    Returns:
+        list: A list of utility matrices, one for each player.
+    """
+    Potential = np.ascontiguousarray(Potential)
+
+    unknown_utilitys = []
+    for p in range(k):
+        # Telescoping sum of the potential differences along the player's own axis
+        U = np.empty_like(Potential)
+        U_p = np.moveaxis(U, p, 0)
+        U_p[0] = 0
+        np.cumsum(np.diff(Potential, axis=p), axis=p, out=np.moveaxis(U_p[1:], 0, p))
+        U += 0.25
+        unknown_utilitys.append(U)
+
+    return unknown_utilitys
+
+def make_game(game_type, n, k, rng=None):
     """
     Creates a game instance based on the given game type, number of strategies (n), and number of players (k).
 
@@ -9,31 +34,21 @@ def make_game(game_type, n, k):
         game_type (str): The type of the game to be created, either "random" or "congestion".
         n (int): The number of strategies for each player.
         k (int): The number of players.
+        rng (numpy.random.Generator): Random number generator to draw the game from (optional).
 
     Returns:
         tuple: A tuple containing the game instance parameters depending on the game type.
     """
+    rng = np.random.default_rng(rng)
 
     if game_type == "random":
         # Create a random potential game with specified dimensions
         shape = [n] * k
-        Potential = rand.randint(-12500, 12501, shape) / 100000
-
-        # Initialize unknown utility matrices for each player
-        unknown_utilitys = [np.zeros(shape) for i in range(k)]
+        # Draw the integer grid as int16 (the range fits) rather than int64 before scaling
+        Potential = rng.integers(-12500, 12501, shape, dtype=np.int16) / 100000
 
         # Calculate the unknown utility matrices for each player based on the potential function
-        for p in range(k):
-            for i in range(1, n):
-                rel_slice = [slice(None)] * p + [i] + [Ellipsis]
-                prev_slice = [slice(None)] * p + [i - 1] + [Ellipsis]
-
-                unknown_utilitys[p][tuple(rel_slice)] = unknown_utilitys[p][tuple(prev_slice)] + Potential[
-                    tuple(rel_slice)] - Potential[tuple(prev_slice)]
-
-        # Add a constant to each player's unknown utility matrix
-        for p in range(k):
-            unknown_utilitys[p] += 0.25
+        unknown_utilitys = utilities_from_potential(Potential, k)
 
         return Potential, unknown_utilitys
 
@@ -41,23 +56,10 @@ def make_game(game_type, n, k):
         # Create a random potential game with specified dimensions
         shape = [n] * k
 
-        Potential = rand.beta(1.0, 3.0, shape) / 2 - 0.25
-
-        # Initialize unknown utility matrices for each player
-        unknown_utilitys = [np.zeros(shape) for i in range(k)]
+        Potential = rng.beta(1.0, 3.0, shape) / 2 - 0.25
 
         # Calculate the unknown utility matrices for each player based on the potential function
-        for p in range(k):
-            for i in range(1, n):
-                rel_slice = [slice(None)] * p + [i] + [Ellipsis]
-                prev_slice = [slice(None)] * p + [i - 1] + [Ellipsis]
-
-                unknown_utilitys[p][tuple(rel_slice)] = unknown_utilitys[p][tuple(prev_slice)] + Potential[
-                    tuple(rel_slice)] - Potential[tuple(prev_slice)]
-
-        # Add a constant to each player's unknown utility matrix
-        for p in range(k):
-            unknown_utilitys[p] += 0.25
+        unknown_utilitys = utilities_from_potential(Potential, k)
 
         return Potential, unknown_utilitys
 
@@ -65,23 +67,10 @@ def make_game(game_type, n, k):
         # Create a random potential game with specified dimensions
         shape = [n] * k
 
-        Potential = rand.beta(3.0, 1.0, shape) / 2 - 0.25
-
-        # Initialize unknown utility matrices for each player
-        unknown_utilitys = [np.zeros(shape) for i in range(k)]
+        Potential = rng.beta(3.0, 1.0, shape) / 2 - 0.25
 
         # Calculate the unknown utility matrices for each player based on the potential function
-        for p in range(k):
-            for i in range(1, n):
-                rel_slice = [slice(None)] * p + [i] + [Ellipsis]
-                prev_slice = [slice(None)] * p + [i - 1] + [Ellipsis]
-
-                unknown_utilitys[p][tuple(rel_slice)] = unknown_utilitys[p][tuple(prev_slice)] + Potential[
-                    tuple(rel_slice)] - Potential[tuple(prev_slice)]
-
-        # Add a constant to each player's unknown utility matrix
-        for p in range(k):
-            unknown_utilitys[p] += 0.25
+        unknown_utilitys = utilities_from_potential(Potential, k)
 
         return Potential, unknown_utilitys
 
@@ -89,23 +78,10 @@ def make_game(game_type, n, k):
         # Create a random potential game with specified dimensions
         shape = [n] * k
 
-        Potential = rand.beta(0.5, 0.5, shape) / 2 - 0.25
-
-        # Initialize unknown utility matrices for each player
-        unknown_utilitys = [np.zeros(shape) for i in range(k)]
+        Potential = rng.beta(0.5, 0.5, shape) / 2 - 0.25
 
         # Calculate the unknown utility matrices for each player based on the potential function
-        for p in range(k):
-            for i in range(1, n):
-                rel_slice = [slice(None)] * p + [i] + [Ellipsis]
-                prev_slice = [slice(None)] * p + [i - 1] + [Ellipsis]
-
-                unknown_utilitys[p][tuple(rel_slice)] = unknown_utilitys[p][tuple(prev_slice)] + Potential[
-                    tuple(rel_slice)] - Potential[tuple(prev_slice)]
-
-        # Add a constant to each player's unknown utility matrix
-        for p in range(k):
-            unknown_utilitys[p] += 0.25
+        unknown_utilitys = utilities_from_potential(Potential, k)
 
         return Potential, unknown_utilitys
 
@@ -113,23 +89,10 @@ def make_game(game_type, n, k):
         # Create a random potential game with specified dimensions
         shape = [n] * k
 
-        Potential = rand.beta(5.0, 5.0, shape) / 2 - 0.25
-
-        # Initialize unknown utility matrices for each player
-        unknown_utilitys = [np.zeros(shape) for i in range(k)]
+        Potential = rng.beta(5.0, 5.0, shape) / 2 - 0.25
 
         # Calculate the unknown utility matrices for each player based on the potential function
-        for p in range(k):
-            for i in range(1, n):
-                rel_slice = [slice(None)] * p + [i] + [Ellipsis]
-                prev_slice = [slice(None)] * p + [i - 1] + [Ellipsis]
-
-                unknown_utilitys[p][tuple(rel_slice)] = unknown_utilitys[p][tuple(prev_slice)] + Potential[
-                    tuple(rel_slice)] - Potential[tuple(prev_slice)]
-
-        # Add a constant to each player's unknown utility matrix
-        for p in range(k):
-            unknown_utilitys[p] += 0.25
+        unknown_utilitys = utilities_from_potential(Potential, k)
 
         return Potential, unknown_utilitys
 
@@ -137,7 +100,7 @@ def make_game(game_type, n, k):
         # Create a random potential game with specified dimensions
         shape = [n] * k
 
-        Potential = rand.randint(-25000, 25001, shape) / 100000
+        Potential = rng.integers(-25000, 25001, shape) / 100000
 
         # Initialize unknown utility matrices for each player
         unknown_utilitys = [Potential for i in range(k)]
@@ -152,14 +115,14 @@ def make_game(game_type, n, k):
         # Create a congestion game with specified number of facilities and agents
         number_facilities = n
         number_agents = k
-        congestion_functions_means = np.flip(np.sort([np.random.uniform(-1, 1, size=k) for i in range(number_facilities)]))
+        congestion_functions_means = np.flip(np.sort([rng.uniform(-1, 1, size=k) for i in range(number_facilities)]))
         return number_facilities, number_agents, congestion_functions_means, None
 
     elif game_type == "single_routing":
         # Create a congestion game with specified number of facilities and agents
         number_facilities = n
         number_agents = k
-        congestion_functions_means = np.flip(np.sort([np.random.uniform(-1, 0, size=k) for i in range(number_facilities)]))
+        congestion_functions_means = np.flip(np.sort([rng.uniform(-1, 0, size=k) for i in range(number_facilities)]))
         actions = [(i,) for i in range(n)]
         action_spaces = [actions for i in range(number_agents)]
         return number_facilities, number_agents, congestion_functions_means, action_spaces
@@ -168,7 +131,7 @@ def make_game(game_type, n, k):
         # Create a congestion game with specified number of facilities and agents
         number_facilities = 6
         number_agents = k
-        congestion_functions_means = np.flip(np.sort([np.random.uniform(-1, 0, size=k) for i in range(6)]))
+        congestion_functions_means = np.flip(np.sort([rng.uniform(-1, 0, size=k) for i in range(6)]))
         actions = [(0,4),(0,2,5),(1,5),(0,3,4)]
         action_spaces = [actions for i in range(number_agents)]
         return number_facilities, number_agents, congestion_functions_means, action_spaces
@@ -1,5 +1,4 @@
 import numpy as np
-import itertools
 
 class regret():
     """
@@ -22,16 +21,9 @@ class regret():
 
         if (s != "nash_ucb"):
 
-            tuples = list(itertools.product(*[range(dim) for dim in game.shape]))
-
-            self.nash_regret_matrix = np.zeros(game.shape)
-            self.potential_regret_matrix = np.zeros(game.shape)
-            self.ni_regret_matrix = np.zeros(game.shape)
-
-            for tuple in tuples:
-                self.nash_regret_matrix[tuple] = nash_regret(game, tuple)
-                self.potential_regret_matrix[tuple] = potential_regret(game, tuple)
-                self.ni_regret_matrix[tuple] = nikaido_isoda_regret(game, tuple)
+            self.nash_regret_matrix = nash_regret(game)
+            self.potential_regret_matrix = potential_regret(game)
+            self.ni_regret_matrix = nikaido_isoda_regret(game)
 
     def av_regret(self):
             return [np.mean(self.nash_regret_matrix), np.mean(self.potential_regret_matrix),np.mean(self.ni_regret_matrix)]
@@ -59,54 +51,55 @@ class regret():
 
 
 
-def potential_regret(game, sample_tuple):
+def potential_regret(game):
     """
-    Compute the potential regret for a given game and action combination.
+    Compute the potential regret for every action combination of a given game.
 
     Args:
         game (object): The game object to compute the regret for.
-        sample_tuple (tuple): The action combination for which to compute the potential regret.
 
     Returns:
-        float: The potential regret for the given game and action combination.
+        numpy.ndarray: The potential regret for each action combination, the maximum potential is only computed once.
+    """
+    return np.max(game.Potential) - game.Potential
+
+def best_response_regrets(game):
+    """
+    Compute each player's best response regret for every action combination of a given game.
+
+    Args:
+        game (object): The game object to compute the regrets for.
+
+    Returns:
+        numpy.ndarray: The best response regrets stacked along the first axis, one slice per player.
     """
-    return np.max(game.Potential) - game.Potential[sample_tuple]
+    # The best response utility along a player's own axis is computed once and broadcast back over that axis
+    return np.stack([np.max(game.utility_matrices[p], axis=p, keepdims=True) - game.utility_matrices[p]
+                     for p in range(game.k)])
 
-def nash_regret(game,sample_tuple):
+def nash_regret(game):
     """
-    Compute the Nash regret for a given game and action combination.
+    Compute the Nash regret for every action combination of a given game.
 
     Args:
         game (object): The game object to compute the regret for.
-        sample_tuple (tuple): The action combination for which to compute the Nash regret.
 
     Returns:
-        float: The Nash regret for the given game and action combination.
+        numpy.ndarray: The Nash regret for each action combination.
     """
-    max_nash_regret = -np.inf
-    for p in range(game.k):
-        cut_slice = [slice(None) if j == p else int(sample_tuple[j]) for j in range(len(sample_tuple))]
-        regret = np.max(game.utility_matrices[p][cut_slice]) - game.utility_matrices[p][sample_tuple]
-        max_nash_regret = max_nash_regret if max_nash_regret > regret else regret
-    return max_nash_regret
-
-def nikaido_isoda_regret(game,sample_tuple):
+    return np.max(best_response_regrets(game), axis=0)
+
+def nikaido_isoda_regret(game):
     """
-    Compute the Nikaido-Isoda regret for a given game and action combination.
+    Compute the Nikaido-Isoda regret for every action combination of a given game.
 
     Args:
         game (object): The game object to compute the regret for.
-        sample_tuple (tuple): The action combination for which to compute the Nikaido-Isoda regret.
 
     Returns:
-        float: The Nikaido-Isoda regret for the given game and action combination.
+        numpy.ndarray: The Nikaido-Isoda regret for each action combination.
     """
-    max_ni_regret = 0
-    for p in range(game.k):
-        cut_slice = [slice(None) if j == p else int(sample_tuple[j]) for j in range(len(sample_tuple))]
-        regret = np.max(game.utility_matrices[p][cut_slice]) - game.utility_matrices[p][sample_tuple]
-        max_ni_regret += regret
-    return max_ni_regret
+    return np.sum(best_response_regrets(game), axis=0)
 
 def tuple_changer(policy_tuple,k,p):
     tuple_list = list(policy_tuple)
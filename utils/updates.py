@@ -1,6 +1,7 @@
 import numpy as np
 from itertools import combinations
 import itertools
+from functools import reduce
 
 def opt_pes_recalc(matrices,opt_us,pes_us,shape):
     """
@@ -17,16 +18,15 @@ def opt_pes_recalc(matrices,opt_us,pes_us,shape):
     tuple: Optimistic and pessimistic estimates
     """
 
-    # Initialize arrays
+    # Initialize arrays, estimates are accumulated over the flattened joint actions
     k = len(shape)
 
-    opt_phi = np.zeros(shape)
-    pes_phi = np.zeros(shape)
-    opt_phi_max = np.zeros(shape)
-    pes_phi_min = np.zeros(shape)
+    opt_phi = np.zeros(int(np.prod(shape)))
+    pes_phi = np.zeros(int(np.prod(shape)))
 
-    # Generate index tuples
-    tuples = list(itertools.product(*[range(dim) for dim in shape]))
+    # Flattened utilities, these are views as the solver keeps its utilities contiguous
+    opt_us = [np.ascontiguousarray(opt_u).ravel() for opt_u in opt_us]
+    pes_us = [np.ascontiguousarray(pes_u).ravel() for pes_u in pes_us]
 
     # Iterate through combinations
     for i in range(k):
@@ -36,41 +36,30 @@ def opt_pes_recalc(matrices,opt_us,pes_us,shape):
         for l in range(len(combo_list)):
 
             # Initialize optimistic and pessimistic estimates
-            opt = np.ones(shape)*float(np.inf)
-            pes = np.ones(shape)*float(-np.inf)
-
-            opt_max = np.ones(shape)*float(-np.inf)
-            pes_min = np.ones(shape)*float(np.inf)
+            opt = np.full(opt_phi.shape, np.inf)
+            pes = np.full(pes_phi.shape, -np.inf)
 
             # Get inactive agents list
             inactive = combo_list[l]
 
+            # Weight matrices of this component, one row per joint action
+            opt_opt, pes_pes, opt_pes, pes_opt = matrices[i][l]
+
             # Iterate through active agents
             for utility_index in [i for i in range(k) if i not in inactive]:
-                opt_y = np.zeros(shape)
-                pes_y = np.zeros(shape)
-
-                # Calculate optimistic and pessimistic estimates for each agent
-                for t in range(len(tuples)):
-                    tuple_ = tuples[t]
-                    opt_y[tuple(tuple_)] = np.sum(np.multiply(matrices[i][l][t][0],opt_us[utility_index])) + np.sum(np.multiply(matrices[i][l][t][2],pes_us[utility_index]))
-                    pes_y[tuple(tuple_)] = np.sum(np.multiply(matrices[i][l][t][3],opt_us[utility_index])) + np.sum(np.multiply(matrices[i][l][t][1],pes_us[utility_index]))
+                # Calculate optimistic and pessimistic estimates for each agent, for all joint actions at once
+                opt_y = opt_opt @ opt_us[utility_index] + opt_pes @ pes_us[utility_index]
+                pes_y = pes_opt @ opt_us[utility_index] + pes_pes @ pes_us[utility_index]
 
                 # Update optimistic and pessimistic min and max
-                opt = np.minimum(opt, opt_y)
-                pes = np.maximum(pes, pes_y)
-
-                opt_max = np.maximum(opt_max, opt_y)
-                pes_min = np.minimum(pes_min, pes_y)
+                np.minimum(opt, opt_y, out=opt)
+                np.maximum(pes, pes_y, out=pes)
 
             # Update summation of components
             opt_phi += opt
             pes_phi += pes
 
-            opt_phi_max += opt_max
-            pes_phi_min += pes_min
-
-    return opt_phi, pes_phi
+    return opt_phi.reshape(shape), pes_phi.reshape(shape)
 
 def opt_pes_make(shape):
     """
@@ -81,7 +70,7 @@ def opt_pes_make(shape):
     k (int): Number of agents
 
     Returns:
-    list: List of the 4 weight matrices for a given component
+    list: The 4 weight matrices of each component, indexed by number of inactive agents and combination
     """
     ks = []
     k = len(shape)
@@ -109,20 +98,25 @@ def opt_pes_mat_make(shape, inactive):
     :param n: int, size of the actions dimensions
     :param k: int, number of agents
     :param inactive: list of int, indices of inactive agents
-    :return: list of numpy arrays, containing the optimistic and pessimistic matrices
+    :return: list of the 4 contiguous weight matrices, row t holds the flattened weights of the t-th joint action
     """
 
-    opt_pes = []
     tuples = list(itertools.product(*[range(dim) for dim in shape]))
 
-    for t in tuples:
-        # Generate the four matrices for the current tuple
-        sum_opt_opt, sum_pes_pes, sum_opt_pes, sum_pes_opt = opt_pes_tuple_make(shape, inactive, t)
+    # Preallocate the flattened weights so each estimate is a single matrix-vector product
+    size = len(tuples)
+    sum_opt_opt = np.empty((size, size))
+    sum_opt_pes = np.empty((size, size))
+
+    for t in range(size):
+        # Generate the matrices for the current tuple
+        opt_opt, pes_pes, opt_pes, pes_opt = opt_pes_tuple_make(shape, inactive, tuples[t])
 
-        # Add the matrices to the opt_pes list
-        opt_pes.append([sum_opt_opt, sum_pes_pes, sum_opt_pes, sum_pes_opt])
+        sum_opt_opt[t] = opt_opt.ravel()
+        sum_opt_pes[t] = opt_pes.ravel()
 
-    return opt_pes
+    # The pessimistic weights equal the optimistic ones, so they share the same arrays
+    return [sum_opt_opt, sum_opt_opt, sum_opt_pes, sum_opt_pes]
 
 def opt_pes_tuple_make(shape, inactive, ind_tuple):
     """
@@ -133,35 +127,22 @@ def opt_pes_tuple_make(shape, inactive, ind_tuple):
     :return: tuple of numpy arrays, containing the four matrices
     """
 
-    num_inactive = len(inactive)
-
-    sum_opt_opt = np.zeros(shape)
-    sum_pes_pes = np.zeros(shape)
-    sum_opt_pes = np.zeros(shape)
-    sum_pes_opt = np.zeros(shape)
-
-    k = len(shape)
-
-    tuples = list(itertools.product(*[range(dim) for dim in shape]))
-
-    for tuple_ in tuples:
-        const = 1
-
-        for ks in [i for i in range(k) if i not in inactive]:
-            if tuple_[ks] == ind_tuple[ks]:
-                const *= (1 - 1 / shape[ks])
-            else:
-                const *= (-1 / shape[ks])
+    # The weight of each tuple is a product of per-agent factors, so build it as an outer product of weight vectors
+    weights = []
+    for ks, dim in enumerate(shape):
+        if ks in inactive:
+            weight = np.full(dim, 1 / dim)
+        else:
+            weight = np.full(dim, -1 / dim)
+            weight[ind_tuple[ks]] = 1 - 1 / dim
+        weights.append(weight)
 
-        for i in inactive:
-            const *= (1 / shape[i])
+    const = reduce(np.multiply.outer, weights)
 
-        if const >= 0:
-            sum_opt_opt[tuple_] = const
-            sum_pes_pes[tuple_] = const
-        else:
-            sum_opt_pes[tuple_] = const
-            sum_pes_opt[tuple_] = const
+    # Split into the positive and negative weights
+    sum_opt_opt = np.where(const >= 0, const, 0)
+    sum_pes_pes = np.copy(sum_opt_opt)
+    sum_opt_pes = np.where(const < 0, const, 0)
+    sum_pes_opt = np.copy(sum_opt_pes)
 
     return sum_opt_opt, sum_pes_pes, sum_opt_pes, sum_pes_opt
-